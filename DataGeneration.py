@@ -1,11 +1,39 @@
 from ast import parse
 import numpy as np
-import pandas as pd
 from scipy import linalg as LA
 from numpy.random import default_rng
 import ham_cr
 import os
+import csv
 import argparse
+from functools import partial
+from multiprocessing import Pool
+
+
+# crystal field Hamiltonian for given (point group, J)
+HAM_CR_BUILDERS = {
+    ('Oh', 3.5): ham_cr.ham_cr_PG_Oh_J_3_5,
+    ('Oh', 4): ham_cr.ham_cr_PG_Oh_J_4,
+    ('Oh', 4.5): ham_cr.ham_cr_PG_Oh_J_4_5,
+    ('Oh', 6): ham_cr.ham_cr_PG_Oh_J_6,
+    ('Oh', 7.5): ham_cr.ham_cr_PG_Oh_J_7_5,
+    ('Oh', 8): ham_cr.ham_cr_PG_Oh_J_8,
+    ('C4v', 3.5): ham_cr.ham_cr_PG_C4v_J_3_5,
+    ('C4v', 4): ham_cr.ham_cr_PG_C4v_J_4,
+    ('C4v', 4.5): ham_cr.ham_cr_PG_C4v_J_4_5,
+    ('C4v', 6): ham_cr.ham_cr_PG_C4v_J_6,
+    ('C4v', 7.5): ham_cr.ham_cr_PG_C4v_J_7_5,
+    ('C4v', 8): ham_cr.ham_cr_PG_C4v_J_8,
+    ('D3h', 3.5): ham_cr.ham_cr_PG_D3h_J_3_5,
+    ('D3h', 4): ham_cr.ham_cr_PG_D3h_J_4,
+    ('D3h', 4.5): ham_cr.ham_cr_PG_D3h_J_4_5,
+    ('D3h', 6): ham_cr.ham_cr_PG_D3h_J_6,
+    ('D3h', 7.5): ham_cr.ham_cr_PG_D3h_J_7_5,
+    ('D3h', 8): ham_cr.ham_cr_PG_D3h_J_8,
+}
+
+# number of Stevens parameters for given point group (C4v and D3h include an additional sign parameter, see generate_random_stevens)
+N_STEVENS_PARAMS = {'Oh': 2, 'C4v': 5+1, 'D3h': 4+1}
 
 
 class training_data:
@@ -17,6 +45,7 @@ class training_data:
         rng_seed: seed of random number generator that draws Stevens parameters (set to 1 per default)
         J, L, S: angular momentum of ion (set to J=4, L=5, S=1 per default)
         B_directions: magnetic field directions that are considered in susc and mag (set to [[0,0,1]] per default)
+        dtype: floating point precision of the eigensolver for cV and mag and of the data written to file (set to np.float64 per default). np.float32 is accurate enough for cV and mag, but susc is always calculated in np.float64 since its small field B would be lost in rounding errors. 
 
     Functions: 
     """
@@ -25,7 +54,7 @@ class training_data:
     # Used to transform magnetic field B from unitsof Tesla to units of Kelvin: [muB*B/k_B] = Kelvin with [B] = Tesla
     muB_over_kB = 0.671713816 
 
-    def __init__(self, point_group = 'Oh', N_t = 1, rng_seed = 1, J = 4, L = 5, S = 1, B_directions = [[0,0,1]]):
+    def __init__(self, point_group = 'Oh', N_t = 1, rng_seed = 1, J = 4, L = 5, S = 1, B_directions = [[0,0,1]], dtype = np.float64):
         self.point_group = point_group
         self.N_t = N_t
         self.rng_seed = rng_seed
@@ -34,27 +63,35 @@ class training_data:
         self.L = L
         self.S = S
         self.B_directions = B_directions
+        self.dtype = np.dtype(dtype)
 
-    ###### define angular momentum operators Jx_op, Jy_op, Jz_op for a given J value #####
+        # crystal field Hamiltonian and number of Stevens parameters are selected once (None if not implemented)
+        self._ham_builder = HAM_CR_BUILDERS.get((point_group, J))
+        self._n_stevens = N_STEVENS_PARAMS.get(point_group)
+
+        # angular momentum operators and Lande factor only depend on J, L, S: compute them once
+        self._Jz = np.diag(np.arange(2*self.J+1,dtype=np.float64) - self.J)
+        self._Jplus = np.diag(np.sqrt((2*self.J - np.arange(2*self.J))*(np.arange(2*self.J)+1)), -1)
+        self._Jminus = np.diag(np.sqrt((2*self.J - np.arange(2*self.J))*(np.arange(2*self.J)+1)), 1)
+        self._Jx = (self._Jplus + self._Jminus)/2.
+        self._Jy = -1j/2.*(self._Jplus - self._Jminus)
+        self._gJLS = float(self.gJLS())
+
+    ###### angular momentum operators Jx_op, Jy_op, Jz_op for a given J value (cached at instantiation, do not modify in place) #####
     def Jz_op(self):
-        mat = np.diag(np.arange(2*self.J+1,dtype=np.float) - self.J)
-        return mat
+        return self._Jz
 
     def Jplus_op(self):
-        mat = np.diag(np.sqrt((2*self.J - np.arange(2*self.J))*(np.arange(2*self.J)+1)), -1)
-        return mat
+        return self._Jplus
 
     def Jminus_op(self):
-        mat = np.diag(np.sqrt((2*self.J - np.arange(2*self.J))*(np.arange(2*self.J)+1)), 1)
-        return mat
+        return self._Jminus
 
     def Jx_op(self):
-        mat = (self.Jplus_op() + self.Jminus_op())/2.
-        return mat
+        return self._Jx
 
     def Jy_op(self):
-        mat = -1j/2.*(self.Jplus_op() - self.Jminus_op())
-        return mat
+        return self._Jy
 
     def gJLS(self):
         return 1 + (self.J*(self.J + 1) + self.S*(self.S+1) - self.L*(self.L+1))/(2*self.J*(self.J + 1))
@@ -70,35 +107,55 @@ class training_data:
         Returns: 
             stevens_params: array with random instances of Stevens parameters
         """
-        # TO DO: implement error messages if range is not correct: in particular, it will get stuck if the range of the x_1, ..., x_{N-1} is not given by [-1,1]
+        return self.generate_random_stevens_batch(W_sign, 1)[0]
+
+    def generate_random_stevens_batch(self, W_sign, N):
+        """
+        Generated N sets of random values for Stevens parameters for given point group. All random numbers are drawn at once. 
+
+        Parameters: 
+            W_sign: sign of W (= x0)
+            N: number of Stevens parameter sets
+        Returns: 
+            stevens_params: array of dimension (N, number of Stevens parameters) with random instances of Stevens parameters
+        """
         if self.point_group == 'Oh': # two Stevens parameters for m-3m = Oh point group
             range = [[0.5, 50],[-1,1]]
-            x0 = (range[0][0] + (range[0][1] - range[0][0])*self.rg.random())*W_sign
-            x1 = range[1][0] + (range[1][1] - range[1][0])*self.rg.random()
-            stevens_params = np.array([x0, x1])
+            u = self.rg.random((N, 2))
+            stevens_params = np.zeros((N, 2))
+            stevens_params[:,0] = (range[0][0] + (range[0][1] - range[0][0])*u[:,0])*W_sign
+            stevens_params[:,1] = range[1][0] + (range[1][1] - range[1][0])*u[:,1]
         elif self.point_group == "C4v": # 5 Stevens parameters for 4mm = C4v point group
-            range = [[0.5, 50],[-1,1],[-1,1],[-1,1],[-1,1]]
-            stevens_params = np.array([1.,1.,1.,1.,1., 0.])
-            while (np.sum(np.abs(stevens_params)) - np.abs(stevens_params[0]) - np.abs(stevens_params[-1]) > 1):
-                stevens_params[0] = (range[0][0] + (range[0][1] - range[0][0])*self.rg.random())*W_sign
-                stevens_params[1] = range[1][0] + (range[1][1] - range[1][0])*self.rg.random()
-                stevens_params[2] = range[2][0] + (range[2][1] - range[2][0])*self.rg.random()
-                stevens_params[3] = range[3][0] + (range[3][1] - range[3][0])*self.rg.random()
-                stevens_params[4] = range[4][0] + (range[4][1] - range[4][0])*self.rg.random()
-            stevens_params[5] = 2.*self.rg.random() - 1. # only sign of x5 matters as size is determined by x1, .., x4. 
+            range = [[0.5, 50]] # x1, ..., x4 are drawn uniformly from |x1| + ... + |x4| <= 1
+            stevens_params = np.zeros((N, 6))
+            stevens_params[:,0] = (range[0][0] + (range[0][1] - range[0][0])*self.rg.random(N))*W_sign
+            stevens_params[:,1:5] = self._random_l1_ball(4, N)
+            stevens_params[:,5] = 2.*self.rg.random(N) - 1. # only sign of x5 matters as size is determined by x1, .., x4. 
         elif self.point_group == "D3h": # 4 Stevens parameters for -6m2 = D3h point group
-            range = [[0.5, 50],[-1,1],[-1,1],[-1,1]]
-            stevens_params = np.array([1.,1.,1.,1., 0.])
-            while (np.sum(np.abs(stevens_params)) - np.abs(stevens_params[0]) - np.abs(stevens_params[-1]) > 1):
-                stevens_params[0] = (range[0][0] + (range[0][1] - range[0][0])*self.rg.random())*W_sign
-                stevens_params[1] = range[1][0] + (range[1][1] - range[1][0])*self.rg.random()
-                stevens_params[2] = range[2][0] + (range[2][1] - range[2][0])*self.rg.random()
-                stevens_params[3] = range[3][0] + (range[3][1] - range[3][0])*self.rg.random()
-            stevens_params[4] = 2.*self.rg.random() - 1. # only sign of x5 matters as size is determined by x1, .., x4. 
+            range = [[0.5, 50]] # x1, ..., x3 are drawn uniformly from |x1| + |x2| + |x3| <= 1
+            stevens_params = np.zeros((N, 5))
+            stevens_params[:,0] = (range[0][0] + (range[0][1] - range[0][0])*self.rg.random(N))*W_sign
+            stevens_params[:,1:4] = self._random_l1_ball(3, N)
+            stevens_params[:,4] = 2.*self.rg.random(N) - 1. # only sign of x5 matters as size is determined by x1, .., x4. 
         else:
             raise ValueError("This point group is not implemented.")
         return stevens_params
             
+    def _random_l1_ball(self, dim, N):
+        """
+        Draws N points uniformly from the L1-ball {x : |x_1| + ... + |x_dim| <= 1} without rejection sampling. 
+        For dim+1 standard exponential variates e_0, ..., e_dim, the point (e_1, ..., e_dim)/(e_0 + ... + e_dim) is uniformly distributed on the simplex {y_i >= 0, y_1 + ... + y_dim <= 1}. Random signs map it uniformly onto the L1-ball. 
+
+        Parameters: 
+            dim: dimension of the L1-ball
+            N: number of points
+        Returns: 
+            x: array of dimension (N, dim)
+        """
+        e = self.rg.standard_exponential((N, dim + 1))
+        signs = 2.*self.rg.integers(0, 2, size=(N, dim)) - 1.
+        return signs*e[:,1:]/np.sum(e, axis=1, keepdims=True)
+            
     ####### Define the crystal field Hamiltonian for given point group and J ##########
     def ham_cr(self, stevens_params):
         """
@@ -109,58 +166,15 @@ class training_data:
         Returns: 
             ham_cr: crystal field Hamiltonian array 
         """
-        if (self.point_group == 'Oh'):  
-            if (len(stevens_params) != 2): 
-                raise ValueError("Number of Stevens parameters should be 2 for point group Oh")
-            if (self.J == 4):
-                return ham_cr.ham_cr_PG_Oh_J_4(stevens_params[0], stevens_params[1])
-            elif (self.J == 7.5):
-                return ham_cr.ham_cr_PG_Oh_J_7_5(stevens_params[0], stevens_params[1])
-            elif (self.J == 3.5):
-                return ham_cr.ham_cr_PG_Oh_J_3_5(stevens_params[0], stevens_params[1])
-            elif (self.J == 6):
-                return ham_cr.ham_cr_PG_Oh_J_6(stevens_params[0], stevens_params[1])
-            elif (self.J == 8):
-                return ham_cr.ham_cr_PG_Oh_J_8(stevens_params[0], stevens_params[1])
-            elif (self.J == 4.5):
-                return ham_cr.ham_cr_PG_Oh_J_4_5(stevens_params[0], stevens_params[1])
-        elif (self.point_group == 'C4v'): 
-            if (len(stevens_params) != 6): 
-                raise ValueError("Number of Stevens parameters should be 5+1=6 for point group C4v")
-            if (self.J == 4):
-                return ham_cr.ham_cr_PG_C4v_J_4(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-            elif (self.J == 7.5):
-                return ham_cr.ham_cr_PG_C4v_J_7_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-            elif (self.J == 3.5):
-                return ham_cr.ham_cr_PG_C4v_J_3_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-            elif (self.J == 6):
-                return ham_cr.ham_cr_PG_C4v_J_6(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-            elif (self.J == 8):
-                return ham_cr.ham_cr_PG_C4v_J_8(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-            elif (self.J == 4.5):
-                return ham_cr.ham_cr_PG_C4v_J_4_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4], stevens_params[5])
-
-        elif (self.point_group == 'D3h'): 
-            if (len(stevens_params) != 5): 
-                raise ValueError("Number of Stevens parameters should be 4+1=5 for point group D3h")
-            if (self.J == 4):
-                return ham_cr.ham_cr_PG_D3h_J_4(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-            elif (self.J == 7.5):
-                return ham_cr.ham_cr_PG_D3h_J_7_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-            elif (self.J == 3.5):
-                return ham_cr.ham_cr_PG_D3h_J_3_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-            elif (self.J == 6):
-                return ham_cr.ham_cr_PG_D3h_J_6(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-            elif (self.J == 8):
-                return ham_cr.ham_cr_PG_D3h_J_8(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-            elif (self.J == 4.5):
-                return ham_cr.ham_cr_PG_D3h_J_4_5(stevens_params[0], stevens_params[1], stevens_params[2], stevens_params[3], stevens_params[4])
-        else: 
+        if self._ham_builder is None:
             raise ValueError("This point group and/or value of J is not implemented.")   
+        if (len(stevens_params) != self._n_stevens): 
+            raise ValueError("Number of Stevens parameters should be %d for point group %s" % (self._n_stevens, self.point_group))
+        return self._ham_builder(*stevens_params)
 
     ####### Calculate specific heat ##################################
 
-    def specific_heat(self, ham, T_min=2, T_max=300, T_steps=150):
+    def specific_heat(self, ham, T_min=2, T_max=300, T_steps=150, T_array=None):
         """
         Returns array of cV/kB for a single rare-earth ion over temperature range [T_min, T_max] for hamiltonian matrix ham. Note that [cV/kB] is dimensionless. To get the specific heat, multiply the result with the Boltzmann constant kB. 
 
@@ -169,35 +183,84 @@ class training_data:
             T_min : minimal temperature in Kelvin
             T_max : maximal temprature in Kelvin
             T_steps: total number of steps in temperature range
+            T_array: (optional) precomputed temperatures in Kelvin, replaces T_min, T_max, T_steps if given
 
         Returns: 
             cV_array: cV/kB for a single rare-earth ion. Array of dimension (T_steps, 2) containing (T_i, cV/kB(T_i) ),             where T_i is temperature at step i 
 
         """  
-        T = np.linspace(T_min, T_max, T_steps) # linearly spaced temperatures
-        energies = LA.eigvalsh(ham)
+        T = np.linspace(T_min, T_max, T_steps) if T_array is None else T_array # linearly spaced temperatures
+        energies = LA.eigh(ham.astype(self.dtype), eigvals_only=True, driver='evr', check_finite=False)
         energies = energies - energies[0]
 
+        # Boltzmann weights for all temperatures at once: array of dimension (T_steps, 2*J+1)
+        w = np.exp(-energies[None,:]/T[:,None])
         # partition function for zero field
-        def Z_cr(T):
-            return np.sum(np.exp(-energies/T))
-        
-        # specific heat expression
-        def cV(T):
-            return 1./(T**2) * (np.sum(energies**2 * np.exp(-energies/T))/Z_cr(T) - np.sum(energies * np.exp(-energies/T)/Z_cr(T))**2)
-
-        cV_array = np.zeros((len(T), 2))
+        Z = np.sum(w, axis=1)
+        # thermal averages <E> and <E^2>
+        E1 = np.sum(energies*w, axis=1)/Z
+        E2 = np.sum(energies**2*w, axis=1)/Z
 
-        #this can probably be optimized using numpy ufuncs, but it is ok for now
-        for i in range(0, len(cV_array)):
-            cV_array[i][0] = T[i]
-            cV_array[i][1] = cV(T[i])
+        # specific heat expression
+        cV_array = np.column_stack([T, (E2 - E1**2)/T**2])
     
         return cV_array
 
+    ######### Shared eigensystem and moment calculation for magnetization and susceptibility ######
+
+    def _J_op(self, B_direction):
+        """
+        Returns angular momentum operator along the (normalized) field direction B_direction = (B_x, B_y, B_z). 
+        The operator is kept real (Jy_op is imaginary) if B_y = 0, so that the Hamiltonian can be diagonalized as a real symmetric matrix. 
+        """
+        B_direction = B_direction/LA.norm(B_direction)
+        J_op = B_direction[0]*self.Jx_op() + B_direction[2]*self.Jz_op()
+        if B_direction[1] != 0:
+            J_op = J_op + B_direction[1]*self.Jy_op()
+        return J_op
+
+    def _eigensystem(self, ham_cr, J_op, B_array, dtype=np.float64):
+        """
+        Diagonalizes ham_cr - gJLS*muB*B*J_op for all fields B in B_array (in Tesla) at once. The Hamiltonians are stacked into an array of dimension (B_steps, 2*J+1, 2*J+1) and diagonalized in a single batched call; numpy.linalg.eigh (unlike scipy.linalg.eigh) accepts stacks of matrices. 
+        The Hamiltonians are cast to the real floating point type dtype (or its complex counterpart if J_op is complex) before diagonalization. 
+        All 2*J+1 levels are computed on purpose: for the implemented Stevens parameter ranges the crystal field spectrum spans at most ~600 K, so every level keeps a Boltzmann weight of order exp(-2) at T = 300 K and a partial eigensolve (e.g. scipy.linalg.eigh with subset_by_index) would drop populated levels. 
+
+        Returns: 
+            energies: array of dimension (B_steps, 2*J+1) with eigenenergies (in Kelvin) measured from the ground state
+            eigenstates: array of dimension (B_steps, 2*J+1, 2*J+1) with eigenvectors as columns
+        """
+        gJLS = self._gJLS
+        # B is given in units of T, ham is in units of K.
+        # ham = ham_cr - B*(gJLS*muB*J_op): scale J_op once and add ham_cr in place into the (B_steps, 2*J+1, 2*J+1) buffer
+        ham = B_array[:,None,None]*(-gJLS*self.muB_over_kB*J_op)
+        ham += ham_cr
+        if np.iscomplexobj(ham):
+            dtype = np.promote_types(dtype, np.complex64)
+        energies, eigenstates = np.linalg.eigh(ham.astype(dtype, copy=False))
+        energies = energies - energies[:,0:1]
+        return energies, eigenstates
+
+    def _moments_from_eigensystem(self, energies, eigenstates, J_op, T_array):
+        """
+        Returns induced moment per R-ion mu/mu_B for already diagonalized Hamiltonian(s) as array of dimension (..., T_steps). 
+
+        Parameters: 
+            energies: array of dimension (..., 2*J+1) with eigenenergies measured from the ground state
+            eigenstates: array of dimension (..., 2*J+1, 2*J+1) with eigenvectors as columns
+            J_op: angular momentum operator along the field direction
+            T_array: temperatures in Kelvin
+        """
+        gJLS = self._gJLS
+        # diagonal matrix elements <n|J_op|n> in the eigenbasis: array of dimension (..., 2*J+1)
+        J_diag = np.einsum('...ji,jk,...ki->...i', np.conjugate(eigenstates), J_op, eigenstates).real
+        # Boltzmann weights: array of dimension (..., T_steps, 2*J+1)
+        w = np.exp(-energies[...,None,:]/T_array[:,None])
+        Z = np.sum(w, axis=-1)
+        return gJLS*np.einsum('...ti,...i->...t', w, J_diag)/Z
+
     ######### Calculate magnetization ##############################
 
-    def magnetization(self, ham_cr, B_direction, B_min=0, B_max=10, B_steps=20, T_min=2, T_max=300, T_steps=4):
+    def magnetization(self, ham_cr, B_direction, B_min=0, B_max=10, B_steps=20, T_min=2, T_max=300, T_steps=4, J_op=None, T_array=None, B_array=None):
         """
         Returns array of moment per R-ion mu/mu_B (over mu_B) over temperature and magnetic field range [T_min, T_max] and [B_min, B_max] for a system with zero-field Hamiltonian matrix ham_cr. Note mu/mu_B is dimensionless. The magnetic field is along B_direction (x, y, z).  
         Parameters: 
@@ -209,43 +272,34 @@ class training_data:
             T_min : minimal temperature in Kelvin
             T_max : maximal temprature in Kelvin
             T_steps: total number of steps in temperature range
+            J_op: (optional) angular momentum operator along B_direction, e.g. precomputed with _J_op(B_direction). Computed from B_direction if None. 
+            T_array: (optional) precomputed temperatures in Kelvin, replaces T_min, T_max, T_steps if given
+            B_array: (optional) precomputed fields in Tesla, replaces B_min, B_max, B_steps if given
 
         Returns: 
             mag_array: induced moment on R-ion mu/muB in array of dimension (T_steps, B_steps, 2) containing (B_i, T_i, mag(B_i, T_i) ), where T_i (B_i) is temperature (field) at step i. Note that this differs by a factor of gJLS from a previous version of the function. 
 
         """  
-        gJLS = float(self.gJLS())
+        if T_array is None:
+            T_array = np.geomspace(T_min, T_max, T_steps)
+        if B_array is None:
+            B_array = np.linspace(B_min, B_max, B_steps)
 
-        T_array = np.geomspace(T_min, T_max, T_steps)
-        B_array = np.linspace(B_min, B_max, B_steps)
-
-        B_direction = B_direction/LA.norm(B_direction)
-        J_op = B_direction[0]*self.Jx_op() + B_direction[1]*self.Jy_op() + B_direction[2]*self.Jz_op()
+        if J_op is None:
+            J_op = self._J_op(B_direction)
+        energies, eigenstates = self._eigensystem(ham_cr, J_op, B_array, self.dtype)
 
         mag_array = np.zeros((len(B_array), len(T_array), 3))
-
-        # this can probably be optimized using numpy ufuncs, but it is ok for now
-        for B_idx in np.arange(0, len(B_array)):
-            B = B_array[B_idx]
-            ham = ham_cr - gJLS*self.muB_over_kB*J_op*B
-            energies, eigenstates = LA.eigh(ham)
-            energies = energies - energies[0]
-            
-            for T_idx in range(0, len(T_array)):
-                T = T_array[T_idx]
-                ZB = np.sum(np.exp(-energies/T))
-                # mag = \mu/\mu_B is moment per R-ion over Bohr magneton. mag is dimensionless. 
-                mag = gJLS/ZB*np.sum([np.dot(np.conjugate(eigenstates[:,i]), np.dot(J_op, eigenstates)[:, i])*np.exp(-energies[i]/T) for i in range(0, len(energies))])
-    
-                mag_array[B_idx][T_idx][0] = B_array[B_idx]
-                mag_array[B_idx][T_idx][1] = T_array[T_idx]
-                mag_array[B_idx][T_idx][2] = mag
+        mag_array[:,:,0] = B_array[:,None]
+        mag_array[:,:,1] = T_array[None,:]
+        # mag = \mu/\mu_B is moment per R-ion over Bohr magneton. mag is dimensionless. 
+        mag_array[:,:,2] = self._moments_from_eigensystem(energies, eigenstates, J_op, T_array)
 
         return mag_array
     
     ########### Calculate magnetic susceptibility ############################
     
-    def susceptibility(self, ham_cr, B_direction, B=0.0001, T_min=1, T_max=300, T_steps=300):
+    def susceptibility(self, ham_cr, B_direction, B=0.0001, T_min=1, T_max=300, T_steps=300, J_op=None, T_array=None):
         """
         Calculated and returns magnetic susceptibility chi_a = mu/(mu_B*B) (units of 1/T) over temperature range [T_min, T_max] for zero-field Hamiltonian matrix ham_cr. Here, mu is the induced moment on the R-ion, mu_B is the Bohr magneton and B the magnetic field. The direction is a=B_direction .
         Parameters: 
@@ -255,41 +309,97 @@ class training_data:
             T_min : minimal temperature in Kelvin
             T_max : maximal temprature in Kelvin
             T_steps: total number of steps in temperature range
+            J_op: (optional) angular momentum operator along B_direction, e.g. precomputed with _J_op(B_direction). Computed from B_direction if None. 
+            T_array: (optional) precomputed temperatures in Kelvin, replaces T_min, T_max, T_steps if given
             
         Returns: 
             susc_array: array of dimension (T_steps, 2) containing (T_i, mu(T_i)/(muB*B), where T_i is temperature at step i and mu(T_i)/mu_B = mag(T_i) is the field induced moment on the R-ion. Note that this differs by a factor of gJLS from a previous version of the function. 
 
         """  
-        gJLS = float(self.gJLS())
+        if T_array is None:
+            T_array = np.linspace(T_min, T_max, T_steps)
 
-        T_array = np.linspace(T_min, T_max, T_steps)
-
-        B_direction = B_direction/LA.norm(B_direction)
-        J_op = B_direction[0]*self.Jx_op() + B_direction[1]*self.Jy_op() + B_direction[2]*self.Jz_op()
+        if J_op is None:
+            J_op = self._J_op(B_direction)
+        energies, eigenstates = self._eigensystem(ham_cr, J_op, np.array([B]))
 
         susc_array = np.zeros((len(T_array), 2))
+        susc_array[:,0] = T_array
+        # susc = mag/B = \mu/(\mu_B B) has units of 1/T, where mag = mu/mu_B and \mu is the field induced moment on the R-ion
+        susc_array[:,1] = self._moments_from_eigensystem(energies[0], eigenstates[0], J_op, T_array)/B
 
-        # this can probably be optimized using numpy ufuncs, but it is ok for now  
-        # B is given in units of T, ham is in units of K.
-        ham = ham_cr - gJLS*self.muB_over_kB*J_op*B
-        energies, eigenstates = LA.eigh(ham)
-        energies = energies - energies[0]
-            
-        for T_idx in range(0, len(T_array)):
-                T = T_array[T_idx]
-                ZB = np.sum(np.exp(-energies/T))
-                # mag = mu/mu_B, where \mu is the field induced moment on the R-ion
-                mag = gJLS/ZB*np.sum([np.dot(np.conjugate(eigenstates[:,i]), np.dot(J_op, eigenstates)[:, i])*np.exp(-energies[i]/T) for i in range(0, len(energies))])
+        return susc_array
 
-                susc_array[T_idx][0] = T_array[T_idx]
-                # susc = mag/B = \mu/(\mu_B B) has units of 1/T
-                susc_array[T_idx][1] = mag/B 
+    ########### Calculate susceptibility and magnetization together ############################
 
-        return susc_array
+    def _susceptibility_and_magnetization(self, ham_cr, B_direction, B, T_susc, T_mag, B_mag, J_op=None):
+        """
+        Returns (susc_array, mag_array) as given by susceptibility(T_array=T_susc) and magnetization(T_array=T_mag, B_array=B_mag) for the same ham_cr and B_direction. 
+        The susceptibility field B is appended to the magnetization field grid so that both observables share a single batched diagonalization (unless self.dtype is reduced precision, see class docstring). 
+        """
+        if J_op is None:
+            J_op = self._J_op(B_direction)
+        if self.dtype == np.float64:
+            energies, eigenstates = self._eigensystem(ham_cr, J_op, np.append(B, B_mag))
+            energies_susc, eigenstates_susc = energies[0], eigenstates[0]
+            energies_mag, eigenstates_mag = energies[1:], eigenstates[1:]
+        else:
+            energies, eigenstates = self._eigensystem(ham_cr, J_op, np.array([B]))
+            energies_susc, eigenstates_susc = energies[0], eigenstates[0]
+            energies_mag, eigenstates_mag = self._eigensystem(ham_cr, J_op, B_mag, self.dtype)
+
+        susc_array = np.zeros((len(T_susc), 2))
+        susc_array[:,0] = T_susc
+        susc_array[:,1] = self._moments_from_eigensystem(energies_susc, eigenstates_susc, J_op, T_susc)/B
+
+        mag_array = np.zeros((len(B_mag), len(T_mag), 3))
+        mag_array[:,:,0] = B_mag[:,None]
+        mag_array[:,:,1] = T_mag[None,:]
+        mag_array[:,:,2] = self._moments_from_eigensystem(energies_mag, eigenstates_mag, J_op, T_mag)
+
+        return susc_array, mag_array
+
+    ######## Compute all observables for a single set of Stevens parameters #################
+
+    def _generate_one(self, stevens_params, J_ops, T_cV, T_susc, T_mag, B_mag):
+        """
+        Computes specific heat, susceptibility and magnetization for a single set of Stevens parameters. 
+        Parameters: 
+            stevens_params: array of Stevens parameters
+            J_ops: list of angular momentum operators along self.B_directions (see _J_op)
+            T_cV, T_susc, T_mag: temperature grids (in Kelvin) for specific heat, susceptibility and magnetization
+            B_mag: field grid (in Tesla) for magnetization
+        Returns: 
+            cV_data: array of dimension (T_steps, 2), see specific_heat
+            susc_data: array of dimension (T_steps, 1 + len(B_directions)) containing (T_i, susc_{0,i}, susc_{1,i}, ...)
+            mag_data: array of dimension (B_steps, T_steps, 2 + len(B_directions)) containing (B_j, T_i, M_{0,i,j}, M_{1,i,j}, ...)
+        """
+        ham_cr = self.ham_cr(stevens_params) # crystal field Hamiltonian for given random Stevens parameters
+
+        # generate specific heat data and store in cV_data
+        cV_data = self.specific_heat(ham_cr, T_array = T_cV)
+
+        B_direction_steps = len(J_ops)
+
+        # generate susceptibility data and store in susc_data (for all B_directions)
+        susc_data = np.zeros((len(T_susc), 1 + B_direction_steps))
+        mag_data = np.zeros((len(B_mag), len(T_mag), 2 + B_direction_steps))
+        
+        for B_direction_idx in range (0, B_direction_steps):
+            B_direction = self.B_directions[B_direction_idx]
+            # susceptibility and magnetization share one (batched) diagonalization per B_direction
+            susc_array, mag_array = self._susceptibility_and_magnetization(ham_cr, B_direction, B = 0.0001, T_susc = T_susc, T_mag = T_mag, B_mag = B_mag, J_op = J_ops[B_direction_idx])
+
+            if (B_direction_idx == 0): 
+                susc_data[:,0] = susc_array[:,0]
+                mag_data[:,:,0:2] = mag_array[:,:,0:2]
+            susc_data[:,1 + B_direction_idx] = susc_array[:,1]
+            mag_data[:,:,2 + B_direction_idx] = mag_array[:,:,2]
+        return cV_data, susc_data, mag_data
 
     ######## Output training data into files #################
 
-    def output_all_data(self, W_sign, cV_T_range = [1, 300, 100], susc_T_range = [1, 300, 100], mag_T_range = [1, 300, 4], mag_B_range = [0.5, 10, 20]):
+    def output_all_data(self, W_sign, cV_T_range = [1, 300, 100], susc_T_range = [1, 300, 100], mag_T_range = [1, 300, 4], mag_B_range = [0.5, 10, 20], n_processes = None):
         """
         Write training data to file
         Parameters: 
@@ -299,6 +409,7 @@ class training_data:
             susc_T_range: [T_min, T_max, T_steps] array for susceptibility calculation
             mag_T_range: [T_min, T_max, T_steps] array for magnetization calculation
             mag_B_range: [B_min, B_max, B_steps], where B_steps is the number of B points within range [B_min, B_max]
+            n_processes: number of worker processes used to compute the training examples (set to os.cpu_count() if None). The Stevens parameters are always drawn in the calling process, so the output does not depend on n_processes. 
         Returns: 
             stevens_params_all: array with parameter values of Stevens parameters
             cV_data_all: array with specific heat values
@@ -306,43 +417,76 @@ class training_data:
             mag_data_all: array with magnetization values
 
         """
-        stevens_params_all = [] 
+        stevens_params_all = [] # use a list to store all Stevens parameters. Since different point groups have different number of Stevens parameters, the tuples that are stored have different length. 
         cV_data_all = []
         susc_data_all = []
         mag_data_all = []
-        for N_t_idx in range(0, self.N_t):
-            stevens_params = self.generate_random_stevens(W_sign) # draw random Stevens parameters
-            stevens_params_all.append(stevens_params) # use a list to store all Stevens parameters. Since different point groups have different number of Stevens parameters, the tuples that are stored have different length. 
-            ham_cr = self.ham_cr(stevens_params) # crystal field Hamiltonian for given random Stevens parameters
-
-            # generate specific heat data and store in cV_data
-            cV_data_all.append(self.specific_heat(ham_cr, T_min = cV_T_range[0], T_max = cV_T_range[1], T_steps = cV_T_range[2]))
-
-            B_direction_steps = len(self.B_directions)
-
-            # generate susceptibility data and store in susc_data (for all B_directions)
-            susc_data = np.zeros((susc_T_range[2], 1 + B_direction_steps))
-            mag_data = np.zeros((mag_B_range[2], mag_T_range[2], 2 + B_direction_steps))
-            
-            for B_direction_idx in range (0, B_direction_steps):
-                B_direction = self.B_directions[B_direction_idx]
-                susc_array = self.susceptibility(ham_cr, B_direction, B = 0.0001, T_min = susc_T_range[0], T_max = susc_T_range[1], T_steps = susc_T_range[2])
-                mag_array = self.magnetization(ham_cr, B_direction, B_min = mag_B_range[0], B_max = mag_B_range[1], B_steps = mag_B_range[2], T_min = mag_T_range[0], T_max = mag_T_range[1], T_steps = mag_T_range[2])
-
-                for T_idx in range (0, len(susc_array)):
-                    if (B_direction_idx == 0): 
-                        susc_data[T_idx][0] = susc_array[T_idx][0]
-                    susc_data[T_idx][1 + B_direction_idx] = susc_array[T_idx][1]
-
-                for B_idx in range (0, mag_B_range[2]):
-                    for T_idx in range(0, mag_T_range[2]):
-                        if (B_direction_idx == 0):
-                            mag_data[B_idx][T_idx][0] = mag_array[B_idx][T_idx][0]
-                            mag_data[B_idx][T_idx][1] = mag_array[B_idx][T_idx][1]
-                        mag_data[B_idx][T_idx][2 + B_direction_idx] = mag_array[B_idx][T_idx][2]
+        for stevens_params, cV_data, susc_data, mag_data in self._iter_data(W_sign, cV_T_range, susc_T_range, mag_T_range, mag_B_range, n_processes):
+            stevens_params_all.append(stevens_params)
+            cV_data_all.append(cV_data)
             susc_data_all.append(susc_data)
             mag_data_all.append(mag_data)
         return stevens_params_all, cV_data_all, susc_data_all, mag_data_all
+
+    def write_all_data(self, W_sign, output_dir, cV_T_range = [1, 300, 100], susc_T_range = [1, 300, 100], mag_T_range = [1, 300, 4], mag_B_range = [0.5, 10, 20], n_processes = None):
+        """
+        Write training data to the files output_dir/generated_data.csv and output_dir/generated_targets.csv. Each training example is written into a single row. 
+        The rows of generated_targets.csv contain the Stevens parameters. The rows of generated_data.csv contain
+            cV/kB(T_i), i = 1, ..., cV T_steps, followed by
+            susc_{d}(T_i), i = 1, ..., susc T_steps, for each B_direction d, followed by
+            M_{d}(B_j, T_i), j = 1, ..., B_steps, for each magnetization temperature T_i and (inner loop) each B_direction d. 
+        The data is written into a preallocated array as the training examples are generated, instead of being collected in lists first. 
+        Parameters: 
+            W_sign: sign of W for Stevens parameters
+            output_dir: output directory
+        Optional parameters: 
+            see output_all_data
+        """
+        B_direction_steps = len(self.B_directions)
+        n_cV = cV_T_range[2]
+        n_susc = B_direction_steps*susc_T_range[2]
+        n_mag = mag_T_range[2]*B_direction_steps*mag_B_range[2]
+        data_arr = np.empty((self.N_t, n_cV + n_susc + n_mag), dtype=self.dtype)
+
+        with open(os.path.join(output_dir, "generated_targets.csv"), "w", newline="") as targets_file:
+            targets_writer = csv.writer(targets_file, lineterminator="\n")
+            for N_t_idx, (stevens_params, cV_data, susc_data, mag_data) in enumerate(self._iter_data(W_sign, cV_T_range, susc_T_range, mag_T_range, mag_B_range, n_processes)):
+                targets_writer.writerow(stevens_params)
+                data_arr[N_t_idx, :n_cV] = cV_data[:,1]
+                # susc_data[:,1:] has dimension (T_steps, B_directions): write B_direction-major
+                data_arr[N_t_idx, n_cV:n_cV + n_susc] = susc_data[:,1:].T.reshape(-1)
+                # mag_data[:,:,2:] has dimension (B_steps, T_steps, B_directions): write T-major, then B_direction, then B
+                data_arr[N_t_idx, n_cV + n_susc:] = mag_data[:,:,2:].transpose(1,2,0).reshape(-1)
+
+        # np.savetxt is considerably faster than writing through a pandas DataFrame. 17 (9) significant digits reproduce float64 (float32) values exactly. 
+        np.savetxt(os.path.join(output_dir, "generated_data.csv"), data_arr, delimiter=",", fmt="%.17g" if self.dtype == np.float64 else "%.9g")
+
+    def _iter_data(self, W_sign, cV_T_range, susc_T_range, mag_T_range, mag_B_range, n_processes = None):
+        """
+        Generator over the N_t training examples, yields (stevens_params, cV_data, susc_data, mag_data) in order (see _generate_one). The parameters are the same as in output_all_data. 
+        """
+        stevens_params_all = self.generate_random_stevens_batch(W_sign, self.N_t) # draw all random Stevens parameters at once
+
+        # angular momentum operators along the B_directions do not depend on the Stevens parameters
+        J_ops = [self._J_op(B_direction) for B_direction in self.B_directions]
+
+        # temperature and field grids are the same for all training examples
+        T_cV = np.linspace(cV_T_range[0], cV_T_range[1], cV_T_range[2])
+        T_susc = np.linspace(susc_T_range[0], susc_T_range[1], susc_T_range[2])
+        T_mag = np.geomspace(mag_T_range[0], mag_T_range[1], mag_T_range[2])
+        B_mag = np.linspace(mag_B_range[0], mag_B_range[1], mag_B_range[2])
+
+        # training examples are independent of each other and are computed in parallel (order is preserved)
+        generate_one = partial(self._generate_one, J_ops = J_ops, T_cV = T_cV, T_susc = T_susc, T_mag = T_mag, B_mag = B_mag)
+        if n_processes is None:
+            n_processes = os.cpu_count()
+        if n_processes == 1:
+            for stevens_params in stevens_params_all:
+                yield (stevens_params,) + generate_one(stevens_params)
+        else:
+            with Pool(n_processes) as pool:
+                for stevens_params, data in zip(stevens_params_all, pool.imap(generate_one, stevens_params_all, chunksize = 64)):
+                    yield (stevens_params,) + data
         
 if __name__=='__main__':
     parser = argparse.ArgumentParser()
@@ -360,6 +504,8 @@ if __name__=='__main__':
     parser.add_argument("-su", "--susc_T_range", type=list, default=[1, 300, 64], help="[T_min, T_max, T_steps] array for susceptibility calculation")
     parser.add_argument("-mT", "--mag_T_range", type=list, default=[1, 300, 3], help="[T_min, T_max, T_steps] array for magnetization calculation")
     parser.add_argument("-mB", "--mag_B_range", type=list, default=[0, 10, 64], help="[B_min, B_max, B_steps], where B_steps is the number of B points within range [B_min, B_max]")
+    parser.add_argument("-sp", "--single_precision", action="store_true", help="Use single precision for specific heat, magnetization and output data")
+    parser.add_argument("-np", "--num_processes", type=int, default=None, help="Number of worker processes (all cores per default)")
 
     args = parser.parse_args()
     POINT_GROUP = args.pg
@@ -375,29 +521,16 @@ if __name__=='__main__':
     SUSC_T_RANGE = args.susc_T_range
     MAG_T_RANGE = args.mag_T_range
     MAG_B_RANGE = args.mag_B_range
+    NUM_PROCESSES = args.num_processes
+    DTYPE = np.float32 if args.single_precision else np.float64
     
-    td = training_data(POINT_GROUP, TRAINING_EXAMPLES, SEED, J, L, S, B_DIRECTIONS)
-    out = td.output_all_data(
+    td = training_data(POINT_GROUP, TRAINING_EXAMPLES, SEED, J, L, S, B_DIRECTIONS, DTYPE)
+    td.write_all_data(
         W_sign = W_SIGN, 
+        output_dir = OUTPUT_DIR, 
         cV_T_range = CV_T_RANGE, 
         susc_T_range = SUSC_T_RANGE, 
         mag_T_range = MAG_T_RANGE, 
-        mag_B_range = MAG_B_RANGE
+        mag_B_range = MAG_B_RANGE,
+        n_processes = NUM_PROCESSES
     )
-    #out[0] # Stevens parameters
-    #out[1] # specific heat [[T_i, cV^(0)_i], [T_i, cV^(1)_i], ..., [T_i, cV^(N_t-1)_i] ], i = 1, ..., T_steps
-    #out[2] # susceptibility [[T_i, susc^(0)_{0,i}, susc^{(0)_{1,i}, ..., susc^(0)_{B_direction-1,i}}], ...], i = 1, ..., T_steps
-    #out[3] # magnetization [[[B_j, T_i, M^(0),{0,i}, M^(0)_{1,i,j}, ..., M^(0)_{B_direction-1,i,j}], ... ]], j = 1, .., B_steps; i = 1, ..., T_steps
-
-    targets_df = pd.DataFrame(out[0])
-    data_arr = np.array(out[1])[:,:,1]
-    for i in range(len(B_DIRECTIONS)): # size of B_directions
-        data_arr = np.concatenate([data_arr, np.array(out[2])[:,:,i+1]], axis=1)
-    for i in range(MAG_T_RANGE[2]): # T step for magnetization
-        for j in range(len(B_DIRECTIONS)): # size of B_directions
-            data_arr = np.concatenate([data_arr, np.array(out[3])[:,:,i,j+2]], axis=1)
-    data_df = pd.DataFrame(data_arr)
-    targets_df.to_csv(os.path.join(OUTPUT_DIR, "generated_targets.csv"), header=None, index=None)
-    data_df.to_csv(os.path.join(OUTPUT_DIR, "generated_data.csv"), header=None, index=None)
-    
-    